@@ -5,20 +5,106 @@ Connects to Arbitrum Sepolia network and processes claims efficiently
 """
 
 import sqlite3
-import json
 import time
 import logging
+import logging.handlers
+import multiprocessing
+import queue
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from datetime import datetime
-from typing import Generator, Tuple, List, Optional
+from typing import Generator, Tuple, List, Dict, Set, Optional, Any, NamedTuple
 from dataclasses import dataclass
 from web3 import Web3
 from eth_account import Account
-from web3.exceptions import TransactionNotFound, TimeExhausted
+from eth_keys.backends import NativeECCBackend, get_backend
+from eth_utils import keccak
+from web3.exceptions import TransactionNotFound
+import requests
+from array import array
 import argparse
 import os
+import sys
 
-# Contract address for the faucet
-CONTRACT_ADDRESS = "0x1bA1526CF49Eb9ECcA86bDC015C4263300E21656"
+from faucet_core import (
+    CONTRACT_ADDRESS,
+    CHAIN_ID,
+    RECEIPT_POLL_MIN,
+    RECEIPT_POLL_BACKOFF,
+    RECEIPT_POLL_MAX,
+    load_abi,
+    build_http_session,
+    build_http2_client,
+    connect,
+    build_claim_tx_dict,
+    sign_tx,
+)
+
+# Maximum number of calls per JSON-RPC batch (public providers reject large arrays)
+RPC_BATCH_LIMIT = 20
+
+# Receipt polling - due receipts are fetched together in batches
+RECEIPT_BATCH_LIMIT = 50
+RECEIPT_TIMEOUT = 30
+
+# How often a batch in progress checks the time limit and stop requests (seconds)
+STOP_CHECK_INTERVAL = 0.5
+
+# Log file writes go through a large buffer and are flushed on errors and shutdown
+LOG_BUFFER_SIZE = 1024 * 1024
+
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that only flushes its buffer for errors instead of after every record"""
+    
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE, encoding=self.encoding)
+    
+    def emit(self, record: logging.LogRecord):
+        if self.stream is None:
+            self.stream = self._open()
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= logging.ERROR:
+                self.stream.flush()
+        except Exception:
+            self.handleError(record)
+
+class TokenBucket:
+    """Thread-safe token bucket limiting the aggregate claim rate across workers"""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def consume(self, tokens: float = 1.0, cancel: Optional[threading.Event] = None) -> bool:
+        """Block until the requested number of tokens is available, or return False once cancel is set"""
+        if self.rate <= 0:
+            return not (cancel is not None and cancel.is_set())
+        
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= tokens:
+                    self.tokens -= tokens
+                    return True
+                
+                wait = (tokens - self.tokens) / self.rate
+            
+            if cancel is None:
+                time.sleep(wait)
+            elif cancel.wait(wait):
+                return False
+
+class WalletRow(NamedTuple):
+    id: int
+    address: str
+    private_key: str
 
 @dataclass
 class ClaimResult:
@@ -28,6 +114,51 @@ class ClaimResult:
     error: Optional[str] = None
     gas_used: Optional[int] = None
 
+class ClaimResultBuffer:
+    """Preallocated column-oriented store of claim outcomes for one batch"""
+    
+    def __init__(self, capacity: int):
+        self.success = array('B', bytes(capacity))
+        self.gas_used = array('Q', bytes(8 * capacity))
+        self.size = 0
+    
+    def append(self, result: ClaimResult):
+        self.success[self.size] = result.success
+        self.gas_used[self.size] = result.gas_used or 0
+        self.size += 1
+    
+    def reset(self):
+        # Only the filled prefix needs clearing; columns keep their allocation
+        self.success[:self.size] = array('B', bytes(self.size))
+        self.gas_used[:self.size] = array('Q', bytes(8 * self.size))
+        self.size = 0
+    
+    def successes(self) -> int:
+        return self.success.count(1)
+    
+    def failures(self) -> int:
+        return self.size - self.successes()
+    
+    def total_gas(self) -> int:
+        return sum(self.gas_used)
+
+@dataclass
+class RpcEndpoint:
+    url: str
+    session: requests.Session
+    w3: Web3
+    client: Any  # Hot-path RPC client: the session itself, or an httpx HTTP/2 client
+
+@dataclass
+class PendingTransaction:
+    tx_hash: str
+    address: str
+    sent_at: float
+    future: Future
+    endpoint: RpcEndpoint
+    poll_delay: float = RECEIPT_POLL_MIN
+    next_poll: float = 0.0
+
 class FaucetClaimer:
     def __init__(
         self, 
@@ -36,7 +167,11 @@ class FaucetClaimer:
         abi_path: str = "abi.json",
         contract_address: str = "",
         gas_limit: int = 100000,
-        gas_price_gwei: float = 0.1
+        gas_price_gwei: float = 0.1,
+        pool_size: int = 64,
+        sign_workers: Optional[int] = None,
+        http2: bool = False,
+        session: Optional[requests.Session] = None
     ):
         self.db_path = db_path
         self.rpc_url = rpc_url
@@ -44,26 +179,66 @@ class FaucetClaimer:
         self.contract_address = contract_address
         self.gas_limit = gas_limit
         self.gas_price_gwei = gas_price_gwei
+        self.sign_workers = (os.cpu_count() or 1) if sign_workers is None else sign_workers
+        
+        # Initialize one Web3 connection per RPC endpoint, each with its own pooled session.
+        # rpc_url may list several comma-separated endpoints to spread wallets across.
+        # A caller-provided session (e.g. the scheduler's) is shared and outlives this claimer
+        self._owns_session = session is None
+        self.endpoints: List[RpcEndpoint] = []
+        for url in [url.strip() for url in rpc_url.split(',') if url.strip()]:
+            endpoint_session = build_http_session(pool_size) if session is None else session
+            self.endpoints.append(RpcEndpoint(
+                url=url,
+                session=endpoint_session,
+                w3=connect(url, endpoint_session),
+                client=build_http2_client(pool_size) if http2 else endpoint_session
+            ))
         
-        # Initialize Web3 connection
-        self.w3 = Web3(Web3.HTTPProvider(rpc_url))
+        # The first endpoint also serves contract setup and connection checks
+        self.session = self.endpoints[0].session
+        self.w3 = self.endpoints[0].w3
         
         # Setup logging
         self.setup_logging()
+        self.check_signing_backend()
         
         # Load contract ABI and initialize contract
         self.contract = None
+        self._request_tokens_fn = None
+        self._claim_data: Optional[str] = None
+        self._contract_address_bytes: Optional[bytes] = None
         self.load_contract()
         
         # Chain ID for Arbitrum Sepolia
-        self.chain_id = 421614
+        self.chain_id = CHAIN_ID
+        
+        # Gas price is fixed for the run, so convert it to wei once
+        self._gas_price_wei = self.w3.to_wei(self.gas_price_gwei, 'gwei')
+        
+        # Sent transactions awaiting receipts, drained by the receipt worker
+        self._pending_q: "queue.Queue[Optional[PendingTransaction]]" = queue.Queue()
+        self._receipt_thread: Optional[threading.Thread] = None
+        
+        # Next nonce per address, fetched once and advanced locally after each send
+        self._nonce_cache: Dict[str, int] = {}
+        self._nonce_lock = threading.Lock()
+        
+        # Signing is CPU-bound, so it runs in worker processes while threads wait on RPCs
+        self._signer: Optional[ProcessPoolExecutor] = None
         
+        # Shared send-rate limiter, configured per run by process_claims (unlimited by default)
+        self._bucket = TokenBucket(rate=0)
+        
+        # Set when a batch is cut short, so senders still waiting on the bucket give up
+        self._halt = threading.Event()
+    
     def setup_logging(self):
         """Setup logging configuration"""
         log_filename = f"faucet_claims_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         
-        # Create file handler with UTF-8 encoding
-        file_handler = logging.FileHandler(log_filename, encoding='utf-8')
+        # Create buffered file handler with UTF-8 encoding
+        file_handler = BufferedFileHandler(log_filename, mode='a', encoding='utf-8')
         
         # Create console handler with proper encoding for Windows
         console_handler = logging.StreamHandler()
@@ -73,257 +248,746 @@ class FaucetClaimer:
         file_handler.setFormatter(formatter)
         console_handler.setFormatter(formatter)
         
+        # Callers only enqueue records; a background listener formats and writes them
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+        self._log_listener.start()
+        self._log_handler = logging.handlers.QueueHandler(log_queue)
+        
         # Configure root logger
-        logging.basicConfig(
-            level=logging.INFO,
-            handlers=[file_handler, console_handler]
-        )
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(self._log_handler)
         
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Faucet Claimer initialized - Log file: {log_filename}")
+    
+    def close(self):
+        """Stop background workers, flush logs and release the HTTP sessions"""
+        self.stop_signer()
+        self.stop_receipt_worker()
+        for endpoint in self.endpoints:
+            if endpoint.client is not endpoint.session:
+                endpoint.client.close()
+            if self._owns_session:
+                endpoint.session.close()
         
+        if self._log_listener is not None:
+            logging.getLogger().removeHandler(self._log_handler)
+            self._log_listener.stop()
+            self._log_listener = None
+    
+    def check_signing_backend(self):
+        """Log which secp256k1 backend eth_account will sign with"""
+        backend = get_backend()
+        if isinstance(backend, NativeECCBackend):
+            self.logger.warning("⚠️  Using pure-Python signing backend - install coincurve for much faster signing")
+        else:
+            self.logger.info(f"🔐 Signing backend: {type(backend).__name__}")
+    
     def load_contract(self):
         """Load contract ABI and initialize contract instance"""
         try:
             if not os.path.exists(self.abi_path):
                 self.logger.warning(f"⚠️  ABI file not found: {self.abi_path}")
                 return
-                
-            with open(self.abi_path, 'r') as f:
-                abi = json.load(f)
+            
+            abi = load_abi(self.abi_path)
             
             if self.contract_address:
                 self.contract = self.w3.eth.contract(
                     address=Web3.to_checksum_address(self.contract_address),
                     abi=abi
                 )
+                
+                # Bind requestTokens() once; it takes no arguments, so its calldata never changes
+                self._request_tokens_fn = self.contract.functions.requestTokens
+                self._claim_data = self.contract.encodeABI(fn_name=self._request_tokens_fn.fn_name)
+                
+                # Raw 20-byte form lets eth_account skip re-validating the checksum on every sign
+                self._contract_address_bytes = bytes.fromhex(self.contract.address[2:])
+                
                 self.logger.info(f"✅ Contract loaded: {self.contract_address}")
             else:
                 self.logger.warning("⚠️  Contract address not provided")
-                
+        
         except Exception as e:
             self.logger.error(f"❌ Failed to load contract: {e}")
     
     def check_connection(self) -> bool:
-        """Check Web3 connection and network"""
+        """Check Web3 connection and network for every RPC endpoint"""
         try:
-            if not self.w3.is_connected():
-                self.logger.error("❌ Failed to connect to RPC endpoint")
-                return False
-            
-            chain_id = self.w3.eth.chain_id
-            latest_block = self.w3.eth.block_number
-            
-            self.logger.info(f"✅ Connected to network - Chain ID: {chain_id}, Latest block: {latest_block}")
-            
-            if chain_id != self.chain_id:
-                self.logger.warning(f"⚠️  Expected chain ID {self.chain_id}, got {chain_id}")
+            for endpoint in self.endpoints:
+                if not endpoint.w3.is_connected():
+                    self.logger.error(f"❌ Failed to connect to RPC endpoint: {endpoint.url}")
+                    return False
+                
+                chain_id = endpoint.w3.eth.chain_id
+                latest_block = endpoint.w3.eth.block_number
+                
+                self.logger.info(
+                    f"✅ Connected to network - Chain ID: {chain_id}, Latest block: {latest_block}"
+                    + (f" ({endpoint.url})" if len(self.endpoints) > 1 else "")
+                )
+                
+                if chain_id != self.chain_id:
+                    self.logger.warning(f"⚠️  Expected chain ID {self.chain_id}, got {chain_id}")
             
             return True
-            
+        
         except Exception as e:
             self.logger.error(f"❌ Connection check failed: {e}")
             return False
     
-    def get_wallet_batches(self, batch_size: int = 500) -> Generator[List[Tuple[int, str, str]], None, None]:
-        """Get wallets from database in batches"""
+    def get_wallet_batches(
+        self,
+        batch_size: int = 500,
+        start_after_id: int = 0
+    ) -> Generator[List[WalletRow], None, None]:
+        """Get wallets from database in batches, resuming after the given wallet id"""
+        conn = None
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.execute("SELECT id, address, private_key FROM wallets ORDER BY id")
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA mmap_size=268435456")
+            conn.execute("PRAGMA cache_size=-65536")
+            # Checksum each address once at load; eth_account requires 'from' in checksum form.
+            # Keys stay as stored, so a malformed one only fails that wallet's claim when signed
+            conn.row_factory = lambda _cursor, row: WalletRow(
+                row[0], Web3.to_checksum_address(row[1]), row[2]
+            )
             
+            # Keyset pagination on the rowid - each batch is a short indexed range scan
+            last_id = start_after_id
             while True:
-                batch = cursor.fetchmany(batch_size)
+                batch = conn.execute(
+                    "SELECT id, address, private_key FROM wallets WHERE id > ? ORDER BY id LIMIT ?",
+                    (last_id, batch_size)
+                ).fetchall()
                 if not batch:
                     break
+                last_id = batch[-1].id
                 yield batch
-                
+        
         except sqlite3.Error as e:
             self.logger.error(f"❌ Database error: {e}")
         finally:
-            conn.close()
+            if conn is not None:
+                conn.close()
+    
+    def endpoint_for(self, wallet_id: int) -> RpcEndpoint:
+        """Pick the RPC endpoint a wallet is sharded to"""
+        return self.endpoints[wallet_id % len(self.endpoints)]
     
-    def get_nonce(self, address: str) -> int:
-        """Get transaction nonce for address"""
+    def rpc_call(self, method: str, params: list, endpoint: Optional[RpcEndpoint] = None) -> Any:
+        """Send a single JSON-RPC call over the pooled client, bypassing web3 middleware"""
+        endpoint = endpoint or self.endpoints[0]
+        response = endpoint.client.post(
+            endpoint.url,
+            json={"jsonrpc": "2.0", "id": 1, "method": method, "params": params},
+            timeout=30
+        )
+        response.raise_for_status()
+        
+        body = response.json()
+        if "error" in body:
+            raise ValueError(body["error"])
+        return body.get("result")
+    
+    def rpc_batch(
+        self,
+        calls: List[Tuple[str, list]],
+        limit: int = RPC_BATCH_LIMIT,
+        endpoint: Optional[RpcEndpoint] = None
+    ) -> List[Any]:
+        """Send JSON-RPC calls as batched requests, returning results in call order"""
+        return [
+            response.get("result")
+            for response in self.rpc_batch_responses(calls, limit, endpoint)
+        ]
+    
+    def rpc_batch_responses(
+        self,
+        calls: List[Tuple[str, list]],
+        limit: int = RPC_BATCH_LIMIT,
+        endpoint: Optional[RpcEndpoint] = None
+    ) -> List[dict]:
+        """Send JSON-RPC calls as batched requests, returning raw responses in call order"""
+        endpoint = endpoint or self.endpoints[0]
+        responses: List[dict] = []
+        
+        for start in range(0, len(calls), limit):
+            chunk = calls[start:start + limit]
+            payload = [
+                {"jsonrpc": "2.0", "id": i, "method": method, "params": params}
+                for i, (method, params) in enumerate(chunk)
+            ]
+            
+            response = endpoint.client.post(endpoint.url, json=payload, timeout=30)
+            response.raise_for_status()
+            
+            # Responses in a batch may arrive in any order - match them by id
+            by_id = {item.get("id"): item for item in response.json()}
+            responses.extend(by_id.get(i, {}) for i in range(len(chunk)))
+        
+        return responses
+    
+    def shard_wallets(self, wallets: List[WalletRow]) -> List[Tuple[RpcEndpoint, List[WalletRow]]]:
+        """Group wallets by the RPC endpoint they are assigned to"""
+        shards: List[List[WalletRow]] = [[] for _ in self.endpoints]
+        for wallet in wallets:
+            shards[wallet.id % len(self.endpoints)].append(wallet)
+        return [(endpoint, shard) for endpoint, shard in zip(self.endpoints, shards) if shard]
+    
+    def prefilter(self, addresses: List[str], endpoint: Optional[RpcEndpoint] = None) -> Set[str]:
+        """Simulate claims with batched eth_call, returning addresses whose claim would revert"""
+        calls = [
+            ("eth_call", [{
+                "from": address,
+                "to": self.contract.address,
+                "data": self._claim_data,
+                "gas": hex(self.gas_limit)
+            }, "latest"])
+            for address in addresses
+        ]
+        
+        try:
+            responses = self.rpc_batch_responses(calls, endpoint=endpoint)
+        except Exception as e:
+            self.logger.warning(f"⚠️  Claim simulation failed, submitting without prefilter: {e}")
+            return set()
+        
+        # Only skip explicit reverts; other errors (rate limits, timeouts) fall through to a real attempt
+        return {
+            address
+            for address, response in zip(addresses, responses)
+            if "revert" in str(response.get("error", {}).get("message", "")).lower()
+        }
+    
+    def prefetch_nonces(
+        self,
+        addresses: List[str],
+        endpoint: Optional[RpcEndpoint] = None
+    ) -> Dict[str, int]:
+        """Warm the nonce cache for many addresses using batched JSON-RPC requests"""
+        with self._nonce_lock:
+            missing = [address for address in addresses if address not in self._nonce_cache]
+        
+        if missing:
+            try:
+                results = self.rpc_batch(
+                    [("eth_getTransactionCount", [address, "pending"]) for address in missing],
+                    endpoint=endpoint
+                )
+            except Exception as e:
+                self.logger.warning(f"⚠️  Batched nonce fetch failed, falling back to per-wallet requests: {e}")
+                results = []
+            
+            with self._nonce_lock:
+                for address, result in zip(missing, results):
+                    if result is not None:
+                        self._nonce_cache.setdefault(address, int(result, 16))
+        
+        with self._nonce_lock:
+            return {
+                address: self._nonce_cache[address]
+                for address in addresses
+                if address in self._nonce_cache
+            }
+    
+    def get_nonce(self, address: str, endpoint: Optional[RpcEndpoint] = None) -> int:
+        """Reserve the next transaction nonce for address"""
+        with self._nonce_lock:
+            nonce = self._nonce_cache.get(address)
+            if nonce is not None:
+                self._nonce_cache[address] = nonce + 1
+                return nonce
+        
         try:
-            return self.w3.eth.get_transaction_count(address)
+            nonce = int(self.rpc_call("eth_getTransactionCount", [address, "pending"], endpoint), 16)
         except Exception as e:
             self.logger.error(f"❌ Failed to get nonce for {address}: {e}")
             return 0
+        
+        with self._nonce_lock:
+            # Another thread may have seeded the cache meanwhile - keep the higher value
+            nonce = max(nonce, self._nonce_cache.get(address, 0))
+            self._nonce_cache[address] = nonce + 1
+        return nonce
+    
+    def invalidate_nonce(self, address: str):
+        """Drop the cached nonce so the next claim refetches it from the network"""
+        with self._nonce_lock:
+            self._nonce_cache.pop(address, None)
     
     def build_claim_transaction(self, wallet_address: str, nonce: int) -> dict:
         """Build faucet claim transaction"""
         if not self.contract:
             raise Exception("Contract not initialized")
         
-        # Build transaction data for requestTokens() function
-        transaction = self.contract.functions.requestTokens().build_transaction({
-            'from': wallet_address,
-            'nonce': nonce,
-            'gas': self.gas_limit,
-            'gasPrice': self.w3.to_wei(self.gas_price_gwei, 'gwei'),
-            'chainId': self.chain_id
-        })
-        
-        return transaction
+        # Assemble the requestTokens() call directly from precomputed fields
+        return build_claim_tx_dict(
+            self._contract_address_bytes,
+            self._claim_data,
+            wallet_address,
+            nonce,
+            self.gas_limit,
+            self._gas_price_wei,
+            self.chain_id
+        )
     
-    def sign_and_send_transaction(self, transaction: dict, private_key: str) -> ClaimResult:
-        """Sign and send transaction"""
+    def start_signer(self):
+        """Start the signing process pool (disabled when sign_workers is 0)"""
+        if self._signer is None and self.sign_workers > 0:
+            # spawn, not fork: the log listener (and, under the scheduler, its logging, stats and
+            # signal handling) is already running, and a forked child would copy that state mid-use
+            self._signer = ProcessPoolExecutor(
+                max_workers=self.sign_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+            # Start every worker now instead of lazily from the first sender threads
+            for future in [self._signer.submit(os.getpid) for _ in range(self.sign_workers)]:
+                future.result()
+    
+    def stop_signer(self):
+        """Shut down the signing process pool"""
+        if self._signer is not None:
+            self._signer.shutdown(wait=True)
+            self._signer = None
+    
+    def sign_transaction(self, transaction: dict, private_key: str) -> bytes:
+        """Sign transaction in the process pool, or inline if it is not running"""
+        if self._signer is not None:
+            return self._signer.submit(sign_tx, transaction, private_key).result()
+        return sign_tx(transaction, private_key)
+    
+    def sign_and_send_transaction(
+        self,
+        transaction: dict,
+        private_key: str,
+        endpoint: Optional[RpcEndpoint] = None
+    ) -> "Future[ClaimResult]":
+        """Sign and send transaction, returning a future resolved once the receipt arrives"""
+        endpoint = endpoint or self.endpoints[0]
+        future: "Future[ClaimResult]" = Future()
+        
         try:
             # Sign transaction
-            signed_txn = self.w3.eth.account.sign_transaction(transaction, private_key)
+            raw_transaction = self.sign_transaction(transaction, private_key)
             
-            # Send transaction
-            tx_hash = self.w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-            tx_hash_hex = tx_hash.hex()
+            # Send the pre-signed bytes straight to the node, within the shared rate limit
+            if not self._bucket.consume(cancel=self._halt):
+                # Batch was cut short before this claim went out - treat it like a queued one
+                self.invalidate_nonce(transaction['from'])
+                future.cancel()
+                future.set_running_or_notify_cancel()  # Wakes as_completed() waiters
+                return future
+            try:
+                tx_hash_hex = self.rpc_call("eth_sendRawTransaction", [Web3.to_hex(raw_transaction)], endpoint)
+            except ValueError as e:
+                # A retried broadcast whose first attempt got through - the node already has it
+                if "already known" not in str(e).lower():
+                    raise
+                tx_hash_hex = Web3.to_hex(keccak(raw_transaction))
             
-            self.logger.info(f"📤 Transaction sent: {tx_hash_hex}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"📤 Transaction sent: {tx_hash_hex}")
             
-            # Wait for transaction receipt (with timeout)
+            # Hand off to the receipt worker instead of blocking on confirmation
+            self._pending_q.put(PendingTransaction(
+                tx_hash=tx_hash_hex,
+                address=transaction['from'],
+                sent_at=time.monotonic(),
+                future=future,
+                endpoint=endpoint
+            ))
+        
+        except Exception as e:
+            # A rejected broadcast does not consume the reserved nonce
+            self.invalidate_nonce(transaction['from'])
+            future.set_result(ClaimResult(
+                address=transaction['from'],
+                success=False,
+                error=str(e)
+            ))
+        
+        return future
+    
+    def start_receipt_worker(self):
+        """Start the background thread that polls receipts for sent transactions"""
+        if self._receipt_thread and self._receipt_thread.is_alive():
+            return
+        
+        self._receipt_thread = threading.Thread(
+            target=self._receipt_worker, name="receipt-worker", daemon=True
+        )
+        self._receipt_thread.start()
+    
+    def stop_receipt_worker(self):
+        """Stop the receipt worker, failing any transactions still pending"""
+        if self._receipt_thread and self._receipt_thread.is_alive():
+            self._pending_q.put(None)
+            self._receipt_thread.join()
+        self._receipt_thread = None
+    
+    def _receipt_worker(self):
+        """Poll receipts for pending transactions in batches with per-transaction backoff"""
+        pending: Dict[str, PendingTransaction] = {}
+        running = True
+        
+        while running:
+            # Sleep until the next receipt is due, waking early when new transactions arrive
+            timeout = None
+            if pending:
+                next_poll = min(tx.next_poll for tx in pending.values())
+                timeout = max(next_poll - time.monotonic(), 0)
             try:
-                receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=30)
-                
-                if receipt.status == 1:
-                    return ClaimResult(
-                        address=transaction['from'],
-                        success=True,
-                        tx_hash=tx_hash_hex,
-                        gas_used=receipt.gasUsed
-                    )
-                else:
-                    return ClaimResult(
-                        address=transaction['from'],
+                item = self._pending_q.get(timeout=timeout)
+                while True:
+                    if item is None:
+                        running = False
+                        break
+                    item.next_poll = item.sent_at + item.poll_delay
+                    pending[item.tx_hash] = item
+                    item = self._pending_q.get_nowait()
+            except queue.Empty:
+                pass
+            
+            if running and pending:
+                self._poll_receipts(pending)
+        
+        for tx in pending.values():
+            tx.future.set_result(ClaimResult(
+                address=tx.address,
+                success=True,  # Assume success since transaction was sent
+                tx_hash=tx.tx_hash,
+                error="Receipt polling stopped (transaction may still succeed)"
+            ))
+    
+    def _poll_receipts(self, pending: Dict[str, PendingTransaction]):
+        """Fetch receipts for transactions that are due, resolving any that completed"""
+        now = time.monotonic()
+        
+        # Ask the endpoint that received each transaction, since it sees it first
+        due: Dict[str, List[str]] = {}
+        for tx_hash, tx in pending.items():
+            if tx.next_poll <= now:
+                due.setdefault(tx.endpoint.url, []).append(tx_hash)
+        
+        tx_hashes: List[str] = []
+        receipts: List[Any] = []
+        for group in due.values():
+            try:
+                receipts.extend(self.rpc_batch(
+                    [("eth_getTransactionReceipt", [tx_hash]) for tx_hash in group],
+                    limit=RECEIPT_BATCH_LIMIT,
+                    endpoint=pending[group[0]].endpoint
+                ))
+            except Exception as e:
+                self.logger.warning(f"⚠️  Receipt polling failed: {e}")
+                receipts.extend([None] * len(group))
+            tx_hashes.extend(group)
+        
+        now = time.monotonic()
+        
+        for tx_hash, receipt in zip(tx_hashes, receipts):
+            tx = pending[tx_hash]
+            
+            if receipt is not None:
+                try:
+                    if int(receipt['status'], 16) == 1:
+                        result = ClaimResult(
+                            address=tx.address,
+                            success=True,
+                            tx_hash=tx_hash,
+                            gas_used=int(receipt['gasUsed'], 16)
+                        )
+                    else:
+                        result = ClaimResult(
+                            address=tx.address,
+                            success=False,
+                            tx_hash=tx_hash,
+                            error="Transaction failed (status: 0)"
+                        )
+                except (KeyError, TypeError, ValueError) as e:
+                    # A malformed receipt must not kill the worker and leave this claim unresolved
+                    result = ClaimResult(
+                        address=tx.address,
                         success=False,
-                        tx_hash=tx_hash_hex,
-                        error="Transaction failed (status: 0)"
+                        tx_hash=tx_hash,
+                        error=f"Malformed receipt: {e!r}"
                     )
-                    
-            except TimeExhausted:
+            elif now - tx.sent_at >= RECEIPT_TIMEOUT:
                 # Transaction was sent but we timed out waiting for receipt
-                return ClaimResult(
-                    address=transaction['from'],
+                result = ClaimResult(
+                    address=tx.address,
                     success=True,  # Assume success since transaction was sent
-                    tx_hash=tx_hash_hex,
+                    tx_hash=tx_hash,
                     error="Receipt timeout (transaction may still succeed)"
                 )
-                
-        except Exception as e:
-            return ClaimResult(
-                address=transaction['from'],
-                success=False,
-                error=str(e)
-            )
+            else:
+                # Not mined yet - check again later with a longer interval
+                tx.poll_delay = min(tx.poll_delay * RECEIPT_POLL_BACKOFF, RECEIPT_POLL_MAX)
+                tx.next_poll = now + tx.poll_delay
+                continue
+            
+            del pending[tx_hash]
+            tx.future.set_result(result)
     
-    def process_wallet_claim(self, wallet_id: int, address: str, private_key: str) -> ClaimResult:
-        """Process faucet claim for a single wallet"""
+    def process_wallet_claim(
+        self,
+        wallet_id: int,
+        address: str,
+        private_key: str,
+        nonce: Optional[int] = None
+    ) -> "Future[ClaimResult]":
+        """Submit faucet claim for a single wallet, returning a future for its result"""
         try:
-            # Get nonce
-            nonce = self.get_nonce(address)
+            endpoint = self.endpoint_for(wallet_id)
+            
+            # Reserve nonce unless one was given explicitly
+            if nonce is None:
+                nonce = self.get_nonce(address, endpoint)
             
             # Build transaction
             transaction = self.build_claim_transaction(address, nonce)
             
             # Sign and send
-            result = self.sign_and_send_transaction(transaction, private_key)
-            
-            # Log result
-            if result.success:
-                self.logger.info(f"✅ Claim successful for {address} - TX: {result.tx_hash}")
-            else:
-                self.logger.error(f"❌ Claim failed for {address} - Error: {result.error}")
-            
-            return result
-            
+            future = self.sign_and_send_transaction(transaction, private_key, endpoint)
+        
         except Exception as e:
             error_msg = f"Unexpected error processing {address}: {e}"
-            self.logger.error(f"❌ {error_msg}")
-            return ClaimResult(address=address, success=False, error=error_msg)
+            future = Future()
+            future.set_result(ClaimResult(address=address, success=False, error=error_msg))
+        
+        # Log result once the receipt has been resolved
+        future.add_done_callback(self._log_claim_result)
+        return future
+    
+    def _log_claim_result(self, future: "Future[ClaimResult]"):
+        """Log the outcome of a completed claim - successes only at DEBUG, batches summarize them"""
+        if future.cancelled():
+            return  # Never sent
+        result = future.result()
+        if result.success:
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"✅ Claim successful for {result.address} - TX: {result.tx_hash}")
+        else:
+            self.logger.error(f"❌ Claim failed for {result.address} - Error: {result.error}")
+    
+    def wait_for_senders(
+        self,
+        futures: List["Future[Future[ClaimResult]]"],
+        deadline: Optional[float],
+        time_limit: Optional[float],
+        stop_event: Optional[threading.Event]
+    ) -> bool:
+        """Wait for a batch's senders, returning False after cancelling the unstarted ones on a timeout or stop"""
+        not_done = set(futures)
+        while not_done:
+            timeout = STOP_CHECK_INTERVAL
+            if deadline is not None:
+                timeout = min(timeout, deadline - time.monotonic())
+                if timeout <= 0:
+                    self.logger.error(f"⏰ Time limit of {time_limit:.0f}s reached - stopping mid-batch")
+                    break
+            if stop_event is not None and stop_event.is_set():
+                self.logger.info("⚠️  Processing interrupted - stopping mid-batch")
+                break
+            _, not_done = wait(not_done, timeout=timeout)
+        
+        if not_done:
+            self._halt.set()
+            for future in not_done:
+                future.cancel()
+        return not not_done
     
     def process_claims(
         self, 
         batch_size: int = 500, 
         delay_between_claims: float = 2.0,
-        max_wallets: Optional[int] = None
-    ):
-        """Process faucet claims for all wallets"""
+        max_wallets: Optional[int] = None,
+        concurrency: int = 16,
+        start_after_id: int = 0,
+        target_rps: Optional[float] = None,
+        prefilter: bool = True,
+        time_limit: Optional[float] = None,
+        stop_event: Optional[threading.Event] = None
+    ) -> bool:
+        """Process faucet claims for all wallets, returning False if the run did not complete
+        
+        Setting stop_event (e.g. from a caller's signal handler) ends the run like Ctrl+C does.
+        """
         if not self.check_connection():
-            return
+            return False
         
         if not self.contract:
             self.logger.error("❌ Contract not initialized - cannot process claims")
-            return
+            return False
         
-        self.logger.info(f"🚀 Starting faucet claims - Batch size: {batch_size}, Delay: {delay_between_claims}s")
+        # All workers share one bucket; without a target rate, pace one send per delay
+        if target_rps:
+            # A capacity below one token would never allow a single send
+            self._bucket = TokenBucket(rate=target_rps, capacity=max(target_rps, 1.0))
+            rate_desc = f"Target: {target_rps} tx/s"
+        else:
+            self._bucket = TokenBucket(rate=1 / delay_between_claims if delay_between_claims > 0 else 0)
+            rate_desc = f"Delay: {delay_between_claims}s"
+        
+        self.logger.info(
+            f"🚀 Starting faucet claims - Batch size: {batch_size}, "
+            f"{rate_desc}, Concurrency: {concurrency}"
+        )
         
         total_processed = 0
         total_successful = 0
-        total_failed = 0
+        total_skipped = 0
+        total_gas_used = 0
+        results = ClaimResultBuffer(batch_size)
         
         start_time = time.time()
+        deadline = time.monotonic() + time_limit if time_limit else None
+        completed = True
+        
+        executor = ThreadPoolExecutor(max_workers=max(concurrency, 1))
+        futures = []
+        self._halt.clear()
+        self.start_signer()
+        self.start_receipt_worker()
         
         try:
-            for batch in self.get_wallet_batches(batch_size):
+            for batch in self.get_wallet_batches(batch_size, start_after_id):
                 batch_start_time = time.time()
-                batch_successful = 0
-                batch_failed = 0
+                
+                # Stop between batches once the time limit is spent; in-flight claims still resolve
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.logger.error(f"⏰ Time limit of {time_limit:.0f}s reached - stopping before next batch")
+                    completed = False
+                    break
+                if stop_event is not None and stop_event.is_set():
+                    self.logger.info("⚠️  Processing interrupted - stopping before next batch")
+                    completed = False
+                    break
                 
                 self.logger.info(f"📦 Processing batch of {len(batch)} wallets...")
                 
-                for wallet_id, address, private_key in batch:
-                    if max_wallets and total_processed >= max_wallets:
+                # Respect the wallet limit before doing any network work
+                pending = batch
+                if max_wallets:
+                    pending = batch[:max(max_wallets - total_processed - total_skipped, 0)]
+                    if not pending:
                         self.logger.info(f"🛑 Reached maximum wallet limit: {max_wallets}")
-                        return
-                    
-                    # Process claim
-                    result = self.process_wallet_claim(wallet_id, address, private_key)
-                    
-                    if result.success:
-                        batch_successful += 1
-                        total_successful += 1
-                    else:
-                        batch_failed += 1
-                        total_failed += 1
-                    
-                    total_processed += 1
+                        break
+                
+                claimable = pending
+                shards = self.shard_wallets(pending)
+                
+                # Drop wallets whose claim would revert (e.g. already claimed) before spending gas
+                if prefilter:
+                    skipped: Set[str] = set()
+                    for endpoint, wallets in shards:
+                        skipped |= self.prefilter([wallet.address for wallet in wallets], endpoint)
                     
-                    # Delay between transactions to avoid rate limiting
-                    if delay_between_claims > 0:
-                        time.sleep(delay_between_claims)
+                    if skipped:
+                        self.logger.info(f"⏭️  Skipping {len(skipped)} wallets whose claim would revert")
+                        claimable = [wallet for wallet in pending if wallet.address not in skipped]
+                        shards = self.shard_wallets(claimable)
+                        total_skipped += len(pending) - len(claimable)
+                
+                # Fetch nonces for the whole batch in as few round-trips per endpoint as possible
+                for endpoint, wallets in shards:
+                    self.prefetch_nonces([wallet.address for wallet in wallets], endpoint)
+                
+                # Each wallet has its own nonce, so claims can be submitted independently
+                futures = [
+                    executor.submit(self.process_wallet_claim, wallet_id, address, private_key)
+                    for wallet_id, address, private_key in claimable
+                ]
                 
-                # Batch summary
+                # Senders return as soon as a transaction is broadcast; receipts resolve later.
+                # A batch can outlast the time limit, so stop sending mid-batch once it is spent
+                cut_short = not self.wait_for_senders(futures, deadline, time_limit, stop_event)
+                receipts = [future.result() for future in futures if not future.cancelled()]
+                
+                for receipt in as_completed(receipts):
+                    if not receipt.cancelled():
+                        results.append(receipt.result())
+                
+                # Fold the batch columns into the running totals, then emit one line per batch
                 batch_time = time.time() - batch_start_time
-                self.logger.info(
-                    f"📊 Batch completed - Success: {batch_successful}, "
-                    f"Failed: {batch_failed}, Time: {batch_time:.2f}s"
-                )
+                batch_successful = results.successes()
+                batch_gas = results.total_gas()
+                
+                total_processed += results.size
+                total_successful += batch_successful
+                total_gas_used += batch_gas
                 
-                # Overall progress
                 elapsed = time.time() - start_time
                 rate = total_processed / elapsed if elapsed > 0 else 0
                 self.logger.info(
-                    f"📈 Overall progress - Processed: {total_processed}, "
-                    f"Success rate: {(total_successful/total_processed)*100:.1f}%, "
+                    f"📊 Batch completed - Success: {batch_successful}, "
+                    f"Failed: {results.size - batch_successful}, Gas: {batch_gas}, "
+                    f"Time: {batch_time:.2f}s | Processed: {total_processed}, "
+                    f"Success rate: {(total_successful/max(total_processed, 1))*100:.1f}%, "
                     f"Rate: {rate:.2f} claims/sec"
                 )
+                results.reset()
+                
+                if cut_short:
+                    completed = False
+                    break
                 
+                if len(pending) < len(batch):
+                    self.logger.info(f"🛑 Reached maximum wallet limit: {max_wallets}")
+                    break
+        
         except KeyboardInterrupt:
             self.logger.info("⚠️  Processing interrupted by user")
+            completed = False
         except Exception as e:
             self.logger.error(f"❌ Fatal error during processing: {e}")
+            completed = False
         finally:
+            # Drop queued claims on early exit and wait for in-flight ones
+            self._halt.set()
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            self.stop_signer()
+            self.stop_receipt_worker()
+            
+            # Include claims from a batch that was cut short
+            total_processed += results.size
+            total_successful += results.successes()
+            total_gas_used += results.total_gas()
+            
             # Final summary
             total_time = time.time() - start_time
             self.logger.info(f"\n🏁 Faucet claiming completed!")
             self.logger.info(f"📊 Total processed: {total_processed}")
             self.logger.info(f"✅ Successful claims: {total_successful}")
-            self.logger.info(f"❌ Failed claims: {total_failed}")
-            self.logger.info(f"📈 Success rate: {(total_successful/total_processed)*100:.1f}%")
+            self.logger.info(f"❌ Failed claims: {total_processed - total_successful}")
+            self.logger.info(f"⏭️  Skipped wallets: {total_skipped}")
+            self.logger.info(f"⛽ Total gas used: {total_gas_used}")
+            self.logger.info(f"📈 Success rate: {(total_successful/max(total_processed, 1))*100:.1f}%")
             self.logger.info(f"⏱️  Total time: {total_time:.2f} seconds")
             self.logger.info(f"🚀 Average rate: {total_processed/total_time:.2f} claims/second")
+        
+        return completed
 
-def main():
+def positive_float(value: str) -> float:
+    """argparse type for options that must be greater than zero"""
+    number = float(value)
+    if number <= 0:
+        raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+    return number
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser, shared by main() and the scheduler"""
     parser = argparse.ArgumentParser(description="Automated Faucet Claiming System")
     parser.add_argument("--db-path", default="wallets.db", help="Path to wallets database")
-    parser.add_argument("--rpc-url", default="https://sepolia-rollup.arbitrum.io/rpc", help="RPC endpoint URL")
+    parser.add_argument("--rpc-url", default="https://sepolia-rollup.arbitrum.io/rpc", help="RPC endpoint URL (comma-separated for several)")
     parser.add_argument("--abi-path", default="abi.json", help="Path to contract ABI file")
     parser.add_argument("--contract-address", default=CONTRACT_ADDRESS, help="Faucet contract address")
     parser.add_argument("--batch-size", type=int, default=500, help="Batch size for processing")
@@ -331,8 +995,28 @@ def main():
     parser.add_argument("--gas-limit", type=int, default=100000, help="Gas limit for transactions")
     parser.add_argument("--gas-price", type=float, default=0.1, help="Gas price in Gwei")
     parser.add_argument("--max-wallets", type=int, help="Maximum number of wallets to process")
+    parser.add_argument("--no-prefilter", action="store_true", help="Submit claims without simulating them first")
+    parser.add_argument("--target-rps", type=positive_float, help="Aggregate transaction send rate (overrides --delay)")
+    parser.add_argument("--start-after-id", type=int, default=0, help="Resume processing after this wallet id")
+    parser.add_argument("--concurrency", type=int, default=16, help="Number of wallets claimed concurrently")
+    parser.add_argument("--sign-workers", type=int, help="Signing processes (default: CPU count, 0 signs inline)")
+    parser.add_argument("--pool-size", type=int, default=64, help="HTTP connection pool size for RPC requests")
+    parser.add_argument("--http2", action="store_true", help="Multiplex RPC calls over HTTP/2 (requires httpx[http2])")
+    parser.add_argument("--time-limit", type=float, help="Stop sending claims after this many seconds, cancelling the rest of the batch")
+    return parser
+
+def main(
+    args: Optional[argparse.Namespace] = None,
+    session: Optional[requests.Session] = None,
+    stop_event: Optional[threading.Event] = None
+) -> int:
+    """Run a claiming pass and return a process exit code
     
-    args = parser.parse_args()
+    Callers running in-process (the scheduler) pass pre-parsed args, a long-lived session
+    and an event they set to stop the pass, since their signal handlers replace Ctrl+C.
+    """
+    if args is None:
+        args = build_parser().parse_args()
     
     claimer = FaucetClaimer(
         db_path=args.db_path,
@@ -340,14 +1024,29 @@ def main():
         abi_path=args.abi_path,
         contract_address=args.contract_address,
         gas_limit=args.gas_limit,
-        gas_price_gwei=args.gas_price
+        gas_price_gwei=args.gas_price,
+        pool_size=args.pool_size,
+        sign_workers=args.sign_workers,
+        http2=args.http2,
+        session=session
     )
     
-    claimer.process_claims(
-        batch_size=args.batch_size,
-        delay_between_claims=args.delay,
-        max_wallets=args.max_wallets
-    )
+    try:
+        completed = claimer.process_claims(
+            batch_size=args.batch_size,
+            delay_between_claims=args.delay,
+            max_wallets=args.max_wallets,
+            concurrency=args.concurrency,
+            start_after_id=args.start_after_id,
+            target_rps=args.target_rps,
+            prefilter=not args.no_prefilter,
+            time_limit=args.time_limit,
+            stop_event=stop_event
+        )
+    finally:
+        claimer.close()
+    
+    return 0 if completed else 1
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    sys.exit(main()) 
\ No newline at end of file
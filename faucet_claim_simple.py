@@ -4,20 +4,24 @@ Simple Faucet Claim Test - Testing basic functionality
 """
 
 import sqlite3
-import json
-import time
 from web3 import Web3
-from eth_account import Account
 
-# Contract address for the faucet
-CONTRACT_ADDRESS = "0x1bA1526CF49Eb9ECcA86bDC015C4263300E21656"
+from faucet_core import (
+    CONTRACT_ADDRESS,
+    CHAIN_ID,
+    load_abi,
+    connect,
+    build_claim_tx_dict,
+    sign_tx,
+    wait_for_receipt,
+)
 
 def test_faucet_claim():
     """Test faucet claiming with one wallet"""
     
     # Setup Web3 connection
     rpc_url = "https://sepolia-rollup.arbitrum.io/rpc"
-    w3 = Web3(Web3.HTTPProvider(rpc_url))
+    w3 = connect(rpc_url)
     
     print("Testing connection...")
     if not w3.is_connected():
@@ -29,8 +33,7 @@ def test_faucet_claim():
     print(f"Latest block: {w3.eth.block_number}")
     
     # Load contract ABI
-    with open("abi.json", "r") as f:
-        abi = json.load(f)
+    abi = load_abi("abi.json")
     
     # Create contract instance
     contract = w3.eth.contract(
@@ -59,32 +62,34 @@ def test_faucet_claim():
     
     # Build transaction
     try:
-        transaction = contract.functions.requestTokens().build_transaction({
-            'from': address,
-            'nonce': nonce,
-            'gas': 100000,
-            'gasPrice': w3.to_wei(0.1, 'gwei'),
-            'chainId': 421614  # Arbitrum Sepolia
-        })
+        transaction = build_claim_tx_dict(
+            bytes.fromhex(contract.address[2:]),
+            contract.encodeABI(fn_name='requestTokens'),
+            address,
+            nonce,
+            gas_limit=100000,
+            gas_price_wei=w3.to_wei(0.1, 'gwei'),
+            chain_id=CHAIN_ID  # Arbitrum Sepolia
+        )
         
         print("Transaction built successfully!")
         print(f"Gas limit: {transaction['gas']}")
         print(f"Gas price: {transaction['gasPrice']}")
         
         # Sign transaction
-        signed_txn = w3.eth.account.sign_transaction(transaction, private_key)
+        raw_transaction = sign_tx(transaction, private_key)
         print("Transaction signed successfully!")
         
         # Send transaction
         print("Sending transaction...")
-        tx_hash = w3.eth.send_raw_transaction(signed_txn.rawTransaction)
-        tx_hash_hex = tx_hash.hex()
+        tx_hash = w3.eth.send_raw_transaction(raw_transaction)
+        tx_hash_hex = Web3.to_hex(tx_hash)
         
         print(f"Transaction sent! Hash: {tx_hash_hex}")
         
         # Wait for receipt
         print("Waiting for confirmation...")
-        receipt = w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+        receipt = wait_for_receipt(w3, tx_hash, timeout=60)
         
         if receipt.status == 1:
             print("SUCCESS: Transaction confirmed!")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Faucet Core - Shared claim steps used by the batch and single-wallet claim scripts
+Plain, fully annotated functions so the module can be compiled with mypyc
+"""
+
+import functools
+import json
+import os
+import time
+from typing import Any, Optional, Union
+from web3 import Web3
+from web3.exceptions import TimeExhausted, TransactionNotFound
+from eth_account import Account
+from eth_keys.datatypes import PrivateKey
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # Optional C-accelerated JSON parser for faster ABI loading
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx  # type: ignore[import-not-found]  # Optional HTTP/2 client for multiplexed RPC traffic
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+# Contract address for the faucet
+CONTRACT_ADDRESS = "0x1bA1526CF49Eb9ECcA86bDC015C4263300E21656"
+
+# Chain ID for Arbitrum Sepolia
+CHAIN_ID = 421614
+
+# Receipt polling - first check shortly after sending, then with a growing interval
+RECEIPT_POLL_MIN = 0.3
+RECEIPT_POLL_BACKOFF = 1.6
+RECEIPT_POLL_MAX = 2.0
+
+def load_abi(path: str) -> list:
+    """Parse a contract ABI file, cached until the file is modified"""
+    return _parse_abi(os.path.abspath(path), os.stat(path).st_mtime_ns)
+
+@functools.lru_cache(maxsize=8)
+def _parse_abi(path: str, mtime_ns: int) -> list:
+    """Parse a contract ABI file, using orjson when it is installed"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def build_http_session(pool_size: int = 64) -> requests.Session:
+    """Build a keep-alive HTTP session with a connection pool for RPC calls"""
+    retry = Retry(
+        total=3,
+        read=0,  # A read timeout may follow an accepted eth_sendRawTransaction - never resend it
+        backoff_factor=0.2,
+        status_forcelist=[429, 502, 503, 504],
+        allowed_methods=frozenset(["POST"])  # JSON-RPC is always POST
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def build_http2_client(pool_size: int = 64) -> Any:
+    """Build an httpx client that multiplexes concurrent RPC calls over HTTP/2 streams"""
+    if httpx is None:
+        raise RuntimeError("HTTP/2 transport requires httpx: pip install 'httpx[http2]'")
+    
+    limits = httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size)
+    transport = httpx.HTTPTransport(http2=True, retries=3, limits=limits)
+    return httpx.Client(http2=True, transport=transport, timeout=30)
+
+def connect(rpc_url: str, session: Optional[requests.Session] = None) -> Web3:
+    """Create a Web3 connection over a pooled keep-alive session"""
+    return Web3(Web3.HTTPProvider(
+        rpc_url,
+        session=session if session is not None else build_http_session(),
+        request_kwargs={'timeout': 30}
+    ))
+
+def build_claim_tx_dict(
+    contract_address: bytes,
+    claim_data: str,
+    sender: str,
+    nonce: int,
+    gas_limit: int,
+    gas_price_wei: int,
+    chain_id: int = CHAIN_ID
+) -> dict:
+    """Assemble a requestTokens() transaction from precomputed fields"""
+    return {
+        'to': contract_address,
+        'data': claim_data,
+        'from': sender,
+        'nonce': nonce,
+        'gas': gas_limit,
+        'gasPrice': gas_price_wei,
+        'chainId': chain_id,
+        'value': 0
+    }
+
+def sign_tx(transaction: dict, private_key: Union[str, PrivateKey]) -> bytes:
+    """Sign a transaction and return the raw bytes (top-level so worker processes can run it)
+    
+    Callers signing repeatedly with one key can pass a parsed PrivateKey, which skips
+    re-deriving the public key on every signature.
+    """
+    return Account.sign_transaction(transaction, private_key).rawTransaction
+
+def wait_for_receipt(w3: Web3, tx_hash: Any, timeout: float = 30) -> Any:
+    """Poll for a transaction receipt with exponential backoff"""
+    delay = RECEIPT_POLL_MIN
+    deadline = time.monotonic() + timeout
+    
+    while True:
+        try:
+            return w3.eth.get_transaction_receipt(tx_hash)
+        except TransactionNotFound:
+            pass  # Still pending
+        
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeExhausted(f"Transaction {Web3.to_hex(tx_hash)} not mined after {timeout} seconds")
+        
+        time.sleep(min(delay, remaining))
+        delay = min(delay * RECEIPT_POLL_BACKOFF, RECEIPT_POLL_MAX)
@@ -7,7 +7,13 @@ Runs faucet claiming process every 24 hours with configurable parameters
 import time
 import subprocess
 import logging
+import logging.handlers
+import queue
+import threading
 import argparse
+import contextlib
+import importlib
+import multiprocessing
 import os
 import signal
 import sys
@@ -18,6 +24,71 @@ import json
 # Contract address for the faucet
 CONTRACT_ADDRESS = "0x1bA1526CF49Eb9ECcA86bDC015C4263300E21656"
 
+# Maximum duration of a single claiming run (seconds)
+RUN_TIME_LIMIT = 3600
+
+# Extra time a worker process gets past RUN_TIME_LIMIT to resolve claims already sent (seconds);
+# the claimer stops submitting mid-batch at the limit, so this covers receipt waits, not batches
+WORKER_GRACE_PERIOD = 300
+
+# Run statistics file, rewritten atomically through a temporary sibling
+STATS_FILE = "scheduler_stats.json"
+
+# How often changed run statistics are written to STATS_FILE (seconds)
+STATS_FLUSH_INTERVAL = 30.0
+
+# Log records buffered before a file write, and the longest they may wait (seconds)
+LOG_BUFFER_RECORDS = 1024
+LOG_FLUSH_INTERVAL = 1.0
+
+def _kill_process_group(process):
+    """Kill a child started in its own session along with everything it spawned"""
+    if not hasattr(os, "killpg"):  # Not available on Windows
+        process.kill()
+        return
+    with contextlib.suppress(ProcessLookupError):  # Whole group already exited
+        os.killpg(process.pid, signal.SIGKILL)
+
+def _claim_worker(conn, log_queue, stop_event):
+    """Long-lived claim process: imports faucet_claim once, then runs one pass per request"""
+    # The scheduler owns shutdown; Ctrl+C in the terminal must not kill a run halfway
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    
+    # Own process group, so a timed-out worker can be killed together with its signing pool
+    if hasattr(os, "setsid"):  # Not available on Windows
+        os.setsid()
+    
+    # Forward every record to the scheduler's log handlers
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    faucet_claim = importlib.import_module("faucet_claim")
+    session = importlib.import_module("faucet_core").build_http_session()
+    
+    while True:
+        try:
+            request = conn.recv()
+        except EOFError:
+            break  # Scheduler went away
+        if request is None:
+            break
+        
+        args = faucet_claim.build_parser().parse_args(request["argv"])
+        
+        # Records already reach the scheduler, so the claimer's own console output is dropped
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            try:
+                returncode = faucet_claim.main(args, session=session, stop_event=stop_event)
+            except Exception as e:
+                logging.getLogger(__name__).error(f"❌ Error executing faucet claiming: {e}")
+                returncode = 1
+        
+        conn.send({"ok": returncode == 0, "returncode": returncode})
+    
+    session.close()
+
 class FaucetScheduler:
     def __init__(
         self,
@@ -30,7 +101,10 @@ class FaucetScheduler:
         gas_limit: int = 100000,
         gas_price_gwei: float = 0.1,
         max_wallets: Optional[int] = None,
-        schedule_interval_hours: int = 24
+        schedule_interval_hours: int = 24,
+        isolated: bool = False,
+        worker: bool = False,
+        verbose: bool = False
     ):
         self.contract_address = contract_address
         self.db_path = db_path
@@ -42,47 +116,169 @@ class FaucetScheduler:
         self.gas_price_gwei = gas_price_gwei
         self.max_wallets = max_wallets
         self.schedule_interval_hours = schedule_interval_hours
+        self.isolated = isolated
+        self.worker = worker
+        self.verbose = verbose
+        
+        # Import the claimer once and keep one pooled session so keep-alive connections
+        # survive across runs; --isolated falls back to a fresh subprocess per run and
+        # --worker keeps one long-lived child process that pays the imports once
+        self.faucet_claim = None
+        self.faucet_core = None
+        self.session = None
+        self._worker_process = None
+        self._worker_conn = None
+        self._worker_log_listener = None
+        self._worker_stop = None
+        self._isolated_process = None
+        if not isolated and not worker:
+            self.faucet_claim = importlib.import_module("faucet_claim")
+            self.faucet_core = importlib.import_module("faucet_core")
+            self.session = self.faucet_core.build_http_session()
         
         # Control flags
         self.running = True
         self.force_run = False
         
+        # Set by signals and run triggers so waits end immediately instead of on the next poll
+        self._wakeup = threading.Event()
+        
+        # Our SIGINT handler replaces KeyboardInterrupt, so in-process and worker runs are
+        # stopped through these events instead
+        self._stop_claims = threading.Event()
+        
         # Setup logging
         self.setup_logging()
         
         # Setup signal handlers for graceful shutdown
         self.setup_signal_handlers()
         
+        # Fail fast on missing files instead of discovering them at the first run
+        self.preflight()
+        
         # Track runs
         self.run_count = 0
         self.last_run_time = None
         self.next_run_time = None
+        self.last_run_success = None
         
+        # Scheduling runs on monotonic time, immune to wall-clock jumps (NTP, DST);
+        # the datetimes above are only for display and persistence
+        self._next_deadline: Optional[float] = None
+        self._stats_dirty = False
+        self._stats_lock = threading.Lock()
+        self._stats_flush_stop = threading.Event()
+        self._stats_flusher: Optional[threading.Thread] = None
+    
     def setup_logging(self):
         """Setup logging configuration"""
         log_filename = f"scheduler_{datetime.now().strftime('%Y%m%d_%H%M%S')}.log"
         
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.FileHandler(log_filename),
-                logging.StreamHandler()
-            ]
+        formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+        self._file_handler = logging.FileHandler(log_filename)
+        self._file_handler.setFormatter(formatter)
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        self._console_handler = console_handler
+        
+        # Coalesce file writes; errors are written through immediately
+        self._memory_handler = logging.handlers.MemoryHandler(
+            LOG_BUFFER_RECORDS,
+            flushLevel=logging.ERROR,
+            target=self._file_handler,
+            flushOnClose=True
         )
         
+        # Callers only enqueue records; a background listener formats and writes them.
+        # The signal handlers log on the main thread, possibly mid-put - SimpleQueue.put is reentrant
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        self._log_listener = logging.handlers.QueueListener(log_queue, self._memory_handler, console_handler)
+        self._log_listener.start()
+        
+        root_logger = logging.getLogger()
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        
+        # Bound how long a buffered record can sit unwritten
+        self._log_flush_stop = threading.Event()
+        self._log_flusher = threading.Thread(target=self._flush_logs_periodically, daemon=True)
+        self._log_flusher.start()
+        
+        # DEBUG is set on the scheduler's own logger; in-process claim runs reset the root level
         self.logger = logging.getLogger(__name__)
+        self.logger.setLevel(logging.DEBUG if self.verbose else logging.INFO)
         self.logger.info(f"🕐 Faucet Scheduler initialized - Log file: {log_filename}")
+    
+    def preflight(self):
+        """Check required files once at startup and warm the ABI cache for in-process runs"""
+        missing = None
+        if self.isolated and not os.path.exists("faucet_claim.py"):
+            self.logger.error("❌ faucet_claim.py not found!")
+            missing = "faucet_claim.py"
+        elif not os.path.exists(self.db_path):
+            self.logger.error(f"❌ Database file not found: {self.db_path}")
+            missing = self.db_path
+        elif not os.path.exists(self.abi_path):
+            self.logger.error(f"❌ ABI file not found: {self.abi_path}")
+            missing = self.abi_path
         
+        if missing is not None:
+            self.stop_logging()
+            raise FileNotFoundError(missing)
+        
+        # Parsed once here; every in-process run reuses faucet_core's cached copy
+        if self.faucet_core is not None:
+            self.faucet_core.load_abi(self.abi_path)
+    
+    def _flush_logs_periodically(self):
+        """Flush buffered log records to the file every LOG_FLUSH_INTERVAL seconds"""
+        while not self._log_flush_stop.wait(LOG_FLUSH_INTERVAL):
+            self._memory_handler.flush()
+    
+    def stop_logging(self):
+        """Drain queued log records and flush them to the log file"""
+        self._log_flush_stop.set()
+        self._log_flusher.join()
+        self._log_listener.stop()
+        self._memory_handler.close()
+        self._file_handler.close()
+    
     def setup_signal_handlers(self):
         """Setup signal handlers for graceful shutdown"""
         def signal_handler(signum, frame):
             self.logger.info(f"🛑 Received signal {signum} - initiating graceful shutdown...")
             self.running = False
+            self._wakeup.set()
+            self._stop_claims.set()
+            if self._worker_stop is not None:
+                self._worker_stop.set()
+            # An --isolated child has its own session, so Ctrl+C in the terminal no longer reaches it
+            process = self._isolated_process
+            if signum == signal.SIGINT and process is not None and hasattr(os, "killpg"):
+                with contextlib.suppress(ProcessLookupError):
+                    os.killpg(process.pid, signal.SIGINT)
+            self.flush_run_stats(blocking=False)  # Persist now in case shutdown is cut short
+        
+        def run_now_handler(signum, frame):
+            self.logger.info(f"⚡ Received signal {signum} - triggering an immediate run...")
+            self.trigger_run()
         
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
-        
+        if hasattr(signal, "SIGUSR1"):  # Not available on Windows
+            signal.signal(signal.SIGUSR1, run_now_handler)
+    
+    def trigger_run(self):
+        """Run the faucet claiming process as soon as the scheduler is idle"""
+        self.force_run = True
+        self._wakeup.set()
+    
+    def wait_for_wakeup(self, seconds: float) -> bool:
+        """Block until the timeout passes or the scheduler is woken, returning True if woken"""
+        woken = self._wakeup.wait(seconds)
+        self._wakeup.clear()
+        return woken
+    
     def calculate_next_run_time(self) -> datetime:
         """Calculate the next scheduled run time"""
         now = datetime.now()
@@ -98,16 +294,25 @@ class FaucetScheduler:
         if self.force_run:
             self.force_run = False
             return True
-            
-        if self.next_run_time is None:
+        
+        if self._next_deadline is None:
             return True
-            
-        return datetime.now() >= self.next_run_time
+        
+        return time.monotonic() >= self._next_deadline
     
-    def build_faucet_command(self) -> list:
-        """Build the command to execute faucet claiming"""
-        cmd = [
-            sys.executable, "faucet_claim.py",
+    def schedule_next_run(self, run_started: Optional[float] = None):
+        """Set the next run's wall-clock time and monotonic deadline"""
+        self.next_run_time = self.calculate_next_run_time()
+        if run_started is not None:
+            self._next_deadline = run_started + self.schedule_interval_hours * 3600
+        else:
+            # Convert a wall-clock schedule (e.g. restored from stats) to a deadline once
+            wait_seconds = (self.next_run_time - datetime.now()).total_seconds()
+            self._next_deadline = time.monotonic() + max(wait_seconds, 0)
+    
+    def build_faucet_args(self) -> list:
+        """Build the faucet_claim command-line arguments for this schedule"""
+        args = [
             "--contract-address", self.contract_address,
             "--db-path", self.db_path,
             "--rpc-url", self.rpc_url,
@@ -119,27 +324,25 @@ class FaucetScheduler:
         ]
         
         if self.max_wallets:
-            cmd.extend(["--max-wallets", str(self.max_wallets)])
+            args.extend(["--max-wallets", str(self.max_wallets)])
         
-        return cmd
+        return args
+    
+    def build_faucet_command(self) -> list:
+        """Build the command to execute faucet claiming in a subprocess"""
+        return [sys.executable, "faucet_claim.py"] + self.build_faucet_args()
     
     def run_faucet_claiming(self) -> bool:
         """Execute the faucet claiming process"""
         self.logger.info("🚀 Starting faucet claiming process...")
         
         try:
-            # Check if required files exist
-            if not os.path.exists("faucet_claim.py"):
-                self.logger.error("❌ faucet_claim.py not found!")
-                return False
+            # Required files were checked once by preflight()
+            if self.worker:
+                return self.run_faucet_claiming_in_worker()
             
-            if not os.path.exists(self.db_path):
-                self.logger.error(f"❌ Database file not found: {self.db_path}")
-                return False
-            
-            if not os.path.exists(self.abi_path):
-                self.logger.error(f"❌ ABI file not found: {self.abi_path}")
-                return False
+            if not self.isolated:
+                return self.run_faucet_claiming_in_process()
             
             # Build and execute command
             cmd = self.build_faucet_command()
@@ -147,63 +350,232 @@ class FaucetScheduler:
             
             start_time = time.time()
             
-            # Run the faucet claiming process
-            process = subprocess.run(
+            # Run the faucet claiming process, streaming its output as it is produced
+            process = subprocess.Popen(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
                 text=True,
-                timeout=3600  # 1 hour timeout
+                errors='replace',
+                bufsize=1,
+                # Own process group, so the signing pool's workers (which also hold the
+                # stdout pipe) can be killed with the claimer
+                start_new_session=True
             )
+            self._isolated_process = process
+            
+            # Watchdog kills the child's whole group once the time limit passes; the read loop then ends
+            timed_out = threading.Event()
+            def kill_on_timeout():
+                timed_out.set()
+                _kill_process_group(process)
+            
+            watchdog = threading.Timer(RUN_TIME_LIMIT, kill_on_timeout)
+            watchdog.daemon = True
+            watchdog.start()
+            
+            try:
+                # The pipe must always be drained, but lines are only formatted when INFO is on
+                echo = self.logger.isEnabledFor(logging.INFO)
+                if echo:
+                    self.logger.info("📄 Process output:")
+                for line in process.stdout:
+                    if echo and line.strip():
+                        self.logger.info(f"   {line.rstrip()}")
+                process.wait()
+            finally:
+                watchdog.cancel()
+                if process.poll() is None:
+                    _kill_process_group(process)
+                    process.wait()
+                process.stdout.close()
+                self._isolated_process = None
             
             execution_time = time.time() - start_time
             
             # Log results
-            if process.returncode == 0:
+            if timed_out.is_set():
+                self.logger.error("❌ Faucet claiming process timed out (1 hour limit)")
+                return False
+            elif process.returncode == 0:
                 self.logger.info(f"✅ Faucet claiming completed successfully in {execution_time:.2f} seconds")
-                self.logger.info("📄 Process output:")
-                for line in process.stdout.split('\n'):
-                    if line.strip():
-                        self.logger.info(f"   {line}")
                 return True
             else:
                 self.logger.error(f"❌ Faucet claiming failed with return code: {process.returncode}")
-                self.logger.error("📄 Error output:")
-                for line in process.stderr.split('\n'):
-                    if line.strip():
-                        self.logger.error(f"   {line}")
                 return False
-                
-        except subprocess.TimeoutExpired:
-            self.logger.error("❌ Faucet claiming process timed out (1 hour limit)")
-            return False
+        
         except Exception as e:
             self.logger.error(f"❌ Error executing faucet claiming: {e}")
             return False
     
+    def run_faucet_claiming_in_process(self) -> bool:
+        """Run faucet claiming in this interpreter, reusing the imported module and session"""
+        args = self.faucet_claim.build_parser().parse_args(
+            self.build_faucet_args() + ["--time-limit", str(RUN_TIME_LIMIT)]
+        )
+        self.logger.info(f"🔧 Running faucet_claim in-process: {' '.join(self.build_faucet_args())}")
+        
+        start_time = time.time()
+        
+        # Claimer log records propagate to the scheduler's handlers; its own console
+        # handler and any stray prints are dropped instead of duplicating output
+        with open(os.devnull, "w") as devnull, \
+                contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+            returncode = self.faucet_claim.main(args, session=self.session, stop_event=self._stop_claims)
+        
+        execution_time = time.time() - start_time
+        
+        if returncode == 0:
+            self.logger.info(f"✅ Faucet claiming completed successfully in {execution_time:.2f} seconds")
+            return True
+        else:
+            self.logger.error(f"❌ Faucet claiming failed with return code: {returncode}")
+            return False
+    
+    def start_claim_worker(self):
+        """Spawn the long-lived claim process and forward its log records"""
+        # spawn, not fork: the scheduler already runs logging threads that fork would copy mid-state
+        ctx = multiprocessing.get_context("spawn")
+        log_queue = ctx.Queue()
+        self._worker_conn, child_conn = ctx.Pipe()
+        self._worker_stop = ctx.Event()
+        # Not a daemon: the claimer starts its own signing pool. It exits on pipe EOF if we die
+        self._worker_process = ctx.Process(target=_claim_worker, args=(child_conn, log_queue, self._worker_stop))
+        self._worker_process.start()
+        child_conn.close()
+        
+        self._worker_log_listener = logging.handlers.QueueListener(
+            log_queue, self._memory_handler, self._console_handler
+        )
+        self._worker_log_listener.start()
+        self.logger.info(f"🧵 Claim worker started (pid {self._worker_process.pid})")
+    
+    def stop_claim_worker(self):
+        """Ask the claim process to exit and stop forwarding its logs"""
+        if self._worker_process is None:
+            return
+        
+        try:
+            self._worker_conn.send(None)
+        except (BrokenPipeError, OSError):
+            pass  # Already gone
+        self._worker_process.join(timeout=10)
+        if self._worker_process.is_alive():
+            _kill_process_group(self._worker_process)
+            self._worker_process.join()
+        
+        self._worker_conn.close()
+        self._worker_log_listener.stop()
+        self._worker_process = None
+        self._worker_conn = None
+        self._worker_stop = None
+        self._worker_log_listener = None
+    
+    def run_faucet_claiming_in_worker(self) -> bool:
+        """Run faucet claiming in the long-lived worker process, respawning it if it died"""
+        if self._worker_process is None or not self._worker_process.is_alive():
+            self.stop_claim_worker()
+            self.start_claim_worker()
+        
+        self.logger.info(f"🔧 Running faucet_claim in worker: {' '.join(self.build_faucet_args())}")
+        start_time = time.time()
+        
+        self._worker_conn.send({
+            "cmd": "run",
+            "argv": self.build_faucet_args() + ["--time-limit", str(RUN_TIME_LIMIT)]
+        })
+        
+        # poll() also returns when the worker dies, after which recv() raises EOFError
+        if not self._worker_conn.poll(RUN_TIME_LIMIT + WORKER_GRACE_PERIOD):
+            self.logger.error("❌ Faucet claiming worker timed out - restarting it")
+            _kill_process_group(self._worker_process)
+            self.stop_claim_worker()
+            return False
+        
+        try:
+            result = self._worker_conn.recv()
+        except EOFError:
+            self.logger.error(f"❌ Faucet claiming worker exited unexpectedly (code {self._worker_process.exitcode})")
+            self.stop_claim_worker()
+            return False
+        
+        execution_time = time.time() - start_time
+        
+        if result["ok"]:
+            self.logger.info(f"✅ Faucet claiming completed successfully in {execution_time:.2f} seconds")
+            return True
+        else:
+            self.logger.error(f"❌ Faucet claiming failed with return code: {result['returncode']}")
+            return False
+    
     def save_run_stats(self, success: bool):
-        """Save run statistics to file"""
+        """Record the latest run result; the stats flusher persists it"""
+        self.last_run_success = success
+        self._stats_dirty = True
+    
+    def _flush_stats_periodically(self):
+        """Write changed run statistics every STATS_FLUSH_INTERVAL seconds"""
+        while not self._stats_flush_stop.wait(STATS_FLUSH_INTERVAL):
+            self.flush_run_stats()
+    
+    def start_stats_flusher(self):
+        """Start the background thread that persists run statistics"""
+        self._stats_flush_stop.clear()
+        self._stats_flusher = threading.Thread(target=self._flush_stats_periodically, daemon=True)
+        self._stats_flusher.start()
+    
+    def stop_stats_flusher(self):
+        """Stop the stats flusher and write any pending changes"""
+        if self._stats_flusher is not None:
+            self._stats_flush_stop.set()
+            self._stats_flusher.join()
+            self._stats_flusher = None
+        self.flush_run_stats()
+    
+    def flush_run_stats(self, blocking: bool = True):
+        """Write run statistics to file if they changed since the last successful write
+        
+        blocking=False skips the write if another flush is in progress (used from signal handlers).
+        """
+        if not self._stats_lock.acquire(blocking=blocking):
+            return
+        try:
+            self._write_run_stats()
+        finally:
+            self._stats_lock.release()
+    
+    def _write_run_stats(self):
+        """Serialize run statistics to STATS_FILE when dirty"""
+        if not self._stats_dirty:
+            return
+        
         stats = {
             "run_count": self.run_count,
             "last_run_time": self.last_run_time.isoformat() if self.last_run_time else None,
             "next_run_time": self.next_run_time.isoformat() if self.next_run_time else None,
-            "last_run_success": success,
+            "last_run_success": self.last_run_success,
             "schedule_interval_hours": self.schedule_interval_hours
         }
         
+        # Write a temporary file and swap it in, so a crash never leaves a truncated stats file
+        tmp_path = STATS_FILE + ".tmp"
         try:
-            with open("scheduler_stats.json", "w") as f:
-                json.dump(stats, f, indent=2)
+            with open(tmp_path, "w") as f:
+                json.dump(stats, f)
+            os.replace(tmp_path, STATS_FILE)
+            self._stats_dirty = False
         except Exception as e:
             self.logger.error(f"❌ Failed to save run stats: {e}")
     
     def load_run_stats(self):
         """Load run statistics from file"""
         try:
-            if os.path.exists("scheduler_stats.json"):
-                with open("scheduler_stats.json", "r") as f:
+            if os.path.exists(STATS_FILE):
+                with open(STATS_FILE, "r") as f:
                     stats = json.load(f)
                 
                 self.run_count = stats.get("run_count", 0)
+                self.last_run_success = stats.get("last_run_success")
                 if stats.get("last_run_time"):
                     self.last_run_time = datetime.fromisoformat(stats["last_run_time"])
                 if stats.get("next_run_time"):
@@ -214,33 +586,46 @@ class FaucetScheduler:
                     self.logger.info(f"📅 Last run: {self.last_run_time}")
                 if self.next_run_time:
                     self.logger.info(f"⏰ Next scheduled run: {self.next_run_time}")
-                    
+        
         except Exception as e:
             self.logger.error(f"❌ Failed to load run stats: {e}")
     
     def wait_with_progress(self, seconds: float):
-        """Wait with progress updates"""
+        """Wait with progress updates (logged at DEBUG)"""
         if seconds <= 0:
             return
-            
-        sleep_interval = min(300, seconds / 10)  # Update every 5 minutes or 10% of wait time
-        remaining = seconds
         
-        while remaining > 0 and self.running:
-            if remaining <= sleep_interval:
-                time.sleep(remaining)
-                break
-            
-            time.sleep(sleep_interval)
-            remaining -= sleep_interval
-            
-            # Progress update
-            hours_remaining = remaining / 3600
-            if hours_remaining >= 1:
-                self.logger.info(f"⏳ Next run in {hours_remaining:.1f} hours...")
-            else:
-                minutes_remaining = remaining / 60
-                self.logger.info(f"⏳ Next run in {minutes_remaining:.1f} minutes...")
+        # Progress lines are DEBUG-only; without them there is nothing to report
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            self.wait_for_wakeup(seconds)
+            return
+        
+        progress_interval = min(300, seconds / 10)  # Update every 5 minutes or 10% of wait time
+        deadline = time.monotonic() + seconds
+        done = threading.Event()
+        
+        def report_progress():
+            while not done.wait(progress_interval):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return
+                
+                # Progress update
+                hours_remaining = remaining / 3600
+                if hours_remaining >= 1:
+                    self.logger.debug(f"⏳ Next run in {hours_remaining:.1f} hours...")
+                else:
+                    minutes_remaining = remaining / 60
+                    self.logger.debug(f"⏳ Next run in {minutes_remaining:.1f} minutes...")
+        
+        # The scheduler parks in a single wait; progress lines come from a side thread
+        reporter = threading.Thread(target=report_progress, daemon=True)
+        reporter.start()
+        try:
+            self.wait_for_wakeup(seconds)
+        finally:
+            done.set()
+            reporter.join()
     
     def run_scheduler(self):
         """Main scheduler loop"""
@@ -253,12 +638,14 @@ class FaucetScheduler:
         self.load_run_stats()
         
         # Calculate initial next run time
-        self.next_run_time = self.calculate_next_run_time()
+        self.schedule_next_run()
+        self.start_stats_flusher()
         
         try:
             while self.running:
                 if self.should_run_now():
                     self.run_count += 1
+                    run_started = time.monotonic()
                     self.last_run_time = datetime.now()
                     
                     self.logger.info(f"🚀 Starting run #{self.run_count} at {self.last_run_time}")
@@ -267,7 +654,7 @@ class FaucetScheduler:
                     success = self.run_faucet_claiming()
                     
                     # Calculate next run time
-                    self.next_run_time = self.calculate_next_run_time()
+                    self.schedule_next_run(run_started)
                     
                     # Save stats
                     self.save_run_stats(success)
@@ -280,21 +667,23 @@ class FaucetScheduler:
                     self.logger.info(f"⏰ Next run scheduled for: {self.next_run_time}")
                 
                 # Calculate wait time until next run
-                now = datetime.now()
-                if self.next_run_time > now:
-                    wait_seconds = (self.next_run_time - now).total_seconds()
+                wait_seconds = self._next_deadline - time.monotonic()
+                if wait_seconds > 0:
                     self.logger.info(f"😴 Waiting {wait_seconds/3600:.1f} hours until next run...")
                     self.wait_with_progress(wait_seconds)
                 else:
                     # Small delay to prevent busy waiting
-                    time.sleep(60)
-                    
+                    self.wait_for_wakeup(60)
+        
         except KeyboardInterrupt:
             self.logger.info("⚠️  Scheduler interrupted by user")
         except Exception as e:
             self.logger.error(f"❌ Scheduler error: {e}")
         finally:
             self.logger.info("🛑 Faucet Scheduler shutting down...")
+            self.stop_claim_worker()
+            self.stop_stats_flusher()  # Final write, also retrying one that failed earlier
+            self.stop_logging()
 
 def main():
     parser = argparse.ArgumentParser(description="Automated Faucet Claiming Scheduler")
@@ -308,21 +697,31 @@ def main():
     parser.add_argument("--gas-price", type=float, default=0.1, help="Gas price in Gwei")
     parser.add_argument("--max-wallets", type=int, help="Maximum number of wallets to process per run")
     parser.add_argument("--interval-hours", type=int, default=24, help="Hours between runs (default: 24)")
+    parser.add_argument("--verbose", action="store_true", help="Log countdown progress while waiting")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--isolated", action="store_true", help="Run each claiming pass in a separate subprocess")
+    mode.add_argument("--worker", action="store_true", help="Run claiming passes in one long-lived child process")
     
     args = parser.parse_args()
     
-    scheduler = FaucetScheduler(
-        contract_address=args.contract_address,
-        db_path=args.db_path,
-        rpc_url=args.rpc_url,
-        abi_path=args.abi_path,
-        batch_size=args.batch_size,
-        delay_between_claims=args.delay,
-        gas_limit=args.gas_limit,
-        gas_price_gwei=args.gas_price,
-        max_wallets=args.max_wallets,
-        schedule_interval_hours=args.interval_hours
-    )
+    try:
+        scheduler = FaucetScheduler(
+            contract_address=args.contract_address,
+            db_path=args.db_path,
+            rpc_url=args.rpc_url,
+            abi_path=args.abi_path,
+            batch_size=args.batch_size,
+            delay_between_claims=args.delay,
+            gas_limit=args.gas_limit,
+            gas_price_gwei=args.gas_price,
+            max_wallets=args.max_wallets,
+            schedule_interval_hours=args.interval_hours,
+            isolated=args.isolated,
+            worker=args.worker,
+            verbose=args.verbose
+        )
+    except FileNotFoundError:
+        sys.exit(1)  # Already logged by preflight()
     
     scheduler.run_scheduler()
 
@@ -4,14 +4,22 @@ Show wallet information from database
 """
 
 import sqlite3
+from typing import Optional
 
-def show_wallets(count=5):
+def connect_db(db_path="wallets.db") -> sqlite3.Connection:
+    """Open the wallets database with name-based row access"""
+    conn = sqlite3.connect(db_path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+def show_wallets(count=5, conn: Optional[sqlite3.Connection] = None):
     """Show wallet details from database"""
+    own_conn = conn is None
     try:
-        conn = sqlite3.connect("wallets.db")
-        cursor = conn.execute(f"SELECT id, address, private_key FROM wallets LIMIT {count}")
-        wallets = cursor.fetchall()
-        conn.close()
+        if own_conn:
+            conn = connect_db()
+        cursor = conn.execute("SELECT id, address, private_key FROM wallets LIMIT ?", (count,))
+        wallets = cursor.fetchmany(count)
         
         if not wallets:
             print("No wallets found in database!")
@@ -20,34 +28,42 @@ def show_wallets(count=5):
         print(f"Found {len(wallets)} wallet(s):")
         print("=" * 80)
         
-        for wallet_id, address, private_key in wallets:
-            print(f"Wallet ID: {wallet_id}")
-            print(f"Address:   {address}")
-            print(f"Private Key: {private_key}")
+        for wallet in wallets:
+            print(f"Wallet ID: {wallet['id']}")
+            print(f"Address:   {wallet['address']}")
+            print(f"Private Key: {wallet['private_key']}")
             print("-" * 80)
-            
+    
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
-def get_wallet_count():
+def get_wallet_count(conn: Optional[sqlite3.Connection] = None):
     """Get total number of wallets in database"""
+    own_conn = conn is None
     try:
-        conn = sqlite3.connect("wallets.db")
+        if own_conn:
+            conn = connect_db()
         cursor = conn.execute("SELECT COUNT(*) FROM wallets")
-        count = cursor.fetchone()[0]
-        conn.close()
-        return count
+        return cursor.fetchone()[0]
     except Exception as e:
         print(f"Error getting wallet count: {e}")
         return 0
+    finally:
+        if own_conn and conn is not None:
+            conn.close()
 
 if __name__ == "__main__":
-    total_wallets = get_wallet_count()
+    # One connection serves both the count and the listing
+    conn = connect_db()
+    total_wallets = get_wallet_count(conn)
     print(f"Total wallets in database: {total_wallets:,}")
     print()
     
     if total_wallets > 0:
-        show_wallets(3)  # Show first 3 wallets
+        show_wallets(3, conn)  # Show first 3 wallets
         
         print("\nThe first wallet shown above was used in the test.")
         print("You can import this wallet into MetaMask or any other wallet app using the private key.")
@@ -56,4 +72,5 @@ if __name__ == "__main__":
         print("2. Visit an Arbitrum Sepolia faucet (like Chainlink, Alchemy, or QuickNode)")
         print("3. Request test ETH to be sent to this address")
     else:
-        print("No wallets found. Run: python wallet_generator.py --count 10") 
\ No newline at end of file
+        print("No wallets found. Run: python wallet_generator.py --count 10")
+    conn.close()
@@ -6,19 +6,98 @@ Optimized for memory efficiency and incremental generation
 
 import sqlite3
 import argparse
+import multiprocessing
 import os
-from eth_account import Account
-from typing import Generator, Tuple
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from eth_keys import keys
+from eth_utils import keccak, to_checksum_address
+from typing import Generator, Iterable, List, Optional, Tuple
 import time
 
+# Insert statements - reusing the same SQL text hits sqlite3's prepared statement cache.
+# Incremental runs insert into the indexed table and let the UNIQUE index drop duplicates;
+# bulk runs append to an index-free stage table with no conflict handling at all, since
+# 256-bit keys make collisions within a run effectively impossible
+INSERT_WALLET_SQL = "INSERT OR IGNORE INTO wallets (address, private_key) VALUES (?, ?)"
+STAGE_WALLET_SQL = "INSERT INTO wallets_stage (address, private_key) VALUES (?, ?)"
+
+# Memory-map up to 256 MiB of the database file for zero-copy page reads
+MMAP_SIZE = 256 * 1024 * 1024
+
+# Page size for new databases - 8K pages keep the address index B-tree shallower
+PAGE_SIZE = 8192
+
+try:
+    import coincurve  # libsecp256k1 bindings - much faster public key derivation
+except ImportError:
+    coincurve = None
+
+def derive_public_key(private_key: bytes) -> bytes:
+    """Return the 64-byte uncompressed public key (without the 0x04 prefix)"""
+    if coincurve is not None:
+        return coincurve.PrivateKey(private_key).public_key.format(compressed=False)[1:]
+    return keys.PrivateKey(private_key).public_key.to_bytes()
+
+def iter_wallets(size: int) -> Generator[Tuple[str, str], None, None]:
+    """Yield (address, private_key) pairs as they are derived"""
+    # One CSPRNG read per chunk; each address is keccak256(public key)[-20:]
+    entropy = os.urandom(32 * size)
+    for offset in range(0, len(entropy), 32):
+        private_key = entropy[offset:offset + 32]
+        while True:
+            try:
+                public_key = derive_public_key(private_key)
+                break
+            except ValueError:
+                private_key = os.urandom(32)  # Outside the curve order - astronomically rare
+        
+        yield (to_checksum_address(keccak(public_key)[-20:]), '0x' + private_key.hex())
+
+def generate_wallet_chunk(size: int) -> List[Tuple[str, str]]:
+    """Generate (address, private_key) pairs (top-level so worker processes can run it)"""
+    return list(iter_wallets(size))
+
+# Key generation pool, created on first use and reused for the life of the process
+_POOL: Optional[ProcessPoolExecutor] = None
+
+def get_pool(workers: Optional[int] = None) -> ProcessPoolExecutor:
+    """Return the shared key generation pool, starting it on first call"""
+    global _POOL
+    if _POOL is None:
+        # Forked workers inherit the already-imported crypto extensions copy-on-write instead
+        # of re-importing them. Only on Linux - fork is unsafe with macOS system frameworks
+        mp_context = None
+        if sys.platform.startswith("linux"):
+            mp_context = multiprocessing.get_context("fork")
+            # keccak and secp256k1 backends load lazily on first use - load them before forking
+            generate_wallet_chunk(1)
+        _POOL = ProcessPoolExecutor(max_workers=workers or os.cpu_count() or 1, mp_context=mp_context)
+        # A fork pool forks all of its workers on the first submit - do that now, not mid-run
+        _POOL.submit(os.getpid).result()
+    return _POOL
+
 class WalletGenerator:
     def __init__(self, db_path: str = "wallets.db"):
         self.db_path = db_path
         self.init_database()
     
+    def connect(self, **kwargs) -> sqlite3.Connection:
+        """Open the database with per-connection read/write tuning applied"""
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute(f"PRAGMA mmap_size={MMAP_SIZE}")
+        return conn
+    
     def init_database(self):
         """Initialize SQLite database with optimized settings"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
+        
+        # page_size only applies before the first table is written, and WAL databases
+        # cannot change it later, so set it ahead of journal_mode. Existing databases
+        # keep their page size rather than paying for an implicit VACUUM
+        conn.execute(f"PRAGMA page_size={PAGE_SIZE}")
         conn.execute("PRAGMA journal_mode=WAL")  # Better performance for concurrent access
         conn.execute("PRAGMA synchronous=NORMAL")  # Balance between safety and speed
         conn.execute("PRAGMA cache_size=10000")  # Increase cache size
@@ -40,7 +119,7 @@ class WalletGenerator:
     
     def get_wallet_count(self) -> int:
         """Get current number of wallets in database"""
-        conn = sqlite3.connect(self.db_path)
+        conn = self.connect()
         cursor = conn.execute("SELECT COUNT(*) FROM wallets")
         count = cursor.fetchone()[0]
         conn.close()
@@ -48,70 +127,138 @@ class WalletGenerator:
     
     def generate_wallet_batch(self, batch_size: int) -> Generator[Tuple[str, str], None, None]:
         """Generate wallets in batches to avoid memory issues"""
-        for _ in range(batch_size):
-            account = Account.create()
-            yield (account.address, account.key.hex())
+        yield from iter_wallets(batch_size)
     
-    def insert_wallets_batch(self, wallets_data: list, conn: sqlite3.Connection) -> int:
+    def insert_wallets_batch(
+        self,
+        wallets_data: Iterable[Tuple[str, str]],
+        conn: sqlite3.Connection,
+        sql: str = INSERT_WALLET_SQL
+    ) -> int:
         """Insert batch of wallets with conflict handling"""
         try:
-            cursor = conn.executemany(
-                "INSERT OR IGNORE INTO wallets (address, private_key) VALUES (?, ?)",
-                wallets_data
-            )
+            cursor = conn.executemany(sql, wallets_data)
             return cursor.rowcount
         except sqlite3.Error as e:
             print(f"Database error during batch insert: {e}")
             return 0
     
-    def generate_wallets(self, count: int, batch_size: int = 1000):
-        """Generate specified number of wallets in batches"""
+    def generate_wallets(
+        self,
+        count: int,
+        batch_size: int = 1000,
+        workers: Optional[int] = None,
+        fast: bool = False,
+        bulk: bool = False
+    ):
+        """Generate specified number of wallets in batches
+        
+        Batches are generated in worker processes while this process inserts them;
+        workers=0 generates inline. fast=True disables fsync for throwaway runs.
+        bulk=True stages rows in an unindexed table and merges them once at the end.
+        """
         print(f"🚀 Starting generation of {count:,} wallets...")
         
         initial_count = self.get_wallet_count()
         print(f"📊 Current wallets in database: {initial_count:,}")
         
-        conn = sqlite3.connect(self.db_path)
-        conn.execute("BEGIN TRANSACTION")
+        # Start the pool before opening the database - SQLite connections must not cross a fork
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        pool = get_pool(workers) if workers > 0 else None
+        
+        # One write transaction for the whole run instead of commit/BEGIN every few batches
+        conn = self.connect(isolation_level=None)
+        if fast:
+            conn.execute("PRAGMA synchronous=OFF")  # A crash may lose the run - just re-run it
+        conn.execute("BEGIN IMMEDIATE")
+        
+        # Bulk loads skip per-row index maintenance; the index is rebuilt once after the merge
+        insert_sql = INSERT_WALLET_SQL
+        if bulk:
+            conn.execute("DROP INDEX IF EXISTS idx_address")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS wallets_stage (
+                    address TEXT NOT NULL,
+                    private_key TEXT NOT NULL
+                )
+            """)
+            insert_sql = STAGE_WALLET_SQL
         
         total_inserted = 0
         processed = 0
         
+        # Keep a few batches in flight per worker so inserts overlap with generation
+        max_in_flight = workers * 2
+        in_flight: deque = deque()
+        
         try:
             # Process in batches to avoid memory issues
             remaining = count
+            to_submit = count
             
             while remaining > 0:
                 current_batch_size = min(batch_size, remaining)
                 
                 # Generate batch of wallets
-                wallet_batch = list(self.generate_wallet_batch(current_batch_size))
+                if pool:
+                    while to_submit > 0 and len(in_flight) < max_in_flight:
+                        chunk_size = min(batch_size, to_submit)
+                        in_flight.append(pool.submit(generate_wallet_chunk, chunk_size))
+                        to_submit -= chunk_size
+                    wallet_batch = in_flight.popleft().result()
+                else:
+                    # Inline rows stream straight into executemany without building a list
+                    wallet_batch = self.generate_wallet_batch(current_batch_size)
                 
                 # Insert batch into database
-                inserted = self.insert_wallets_batch(wallet_batch, conn)
+                inserted = self.insert_wallets_batch(wallet_batch, conn, insert_sql)
                 total_inserted += inserted
                 processed += current_batch_size
                 remaining -= current_batch_size
                 
-                # Commit every few batches to avoid long transactions
-                if processed % (batch_size * 5) == 0:
-                    conn.commit()
-                    conn.execute("BEGIN TRANSACTION")
-                
                 # Progress update
                 if processed % batch_size == 0:
                     progress = (processed / count) * 100
                     print(f"⏳ Progress: {processed:,}/{count:,} ({progress:.1f}%) - "
                           f"Inserted: {total_inserted:,} new wallets")
             
-            # Final commit
-            conn.commit()
+            # Merge staged rows in address order so the UNIQUE index is appended to sequentially.
+            # OR IGNORE stays here only to guard against rows already in the table - inserting
+            # into the index performs that lookup anyway, so it costs no extra probe
+            if bulk:
+                print("🔀 Merging staged wallets and rebuilding address index...")
+                cursor = conn.execute("""
+                    INSERT OR IGNORE INTO wallets (address, private_key)
+                    SELECT address, private_key FROM wallets_stage ORDER BY address
+                """)
+                total_inserted = cursor.rowcount
+                conn.execute("DROP TABLE wallets_stage")
+                conn.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_address ON wallets(address)")
             
+            # Final commit, then fold the WAL back into the database file
+            conn.execute("COMMIT")
+            conn.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        
+        except KeyboardInterrupt:
+            # Rows already written are complete wallets, so keep them. A bulk load is only
+            # consistent once merged and re-indexed, so it is discarded
+            if conn.in_transaction:
+                if bulk:
+                    conn.execute("ROLLBACK")
+                    print("⚠️  Bulk load interrupted - staged wallets were discarded")
+                else:
+                    conn.execute("COMMIT")
+                    saved = conn.execute("SELECT COUNT(*) FROM wallets").fetchone()[0] - initial_count
+                    print(f"💾 Saved {saved:,} wallets generated before the interruption")
+            raise
         except Exception as e:
-            conn.rollback()
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
             print(f"❌ Error during wallet generation: {e}")
             raise
         finally:
+            for future in in_flight:
+                future.cancel()
             conn.close()
         
         final_count = self.get_wallet_count()
@@ -145,6 +292,21 @@ def main():
         default="wallets.db", 
         help="Path to SQLite database file (default: wallets.db)"
     )
+    parser.add_argument(
+        "--fast", 
+        action="store_true", 
+        help="Disable fsync while generating (faster, but a crash can lose the run)"
+    )
+    parser.add_argument(
+        "--bulk", 
+        action="store_true", 
+        help="Stage rows in an unindexed table and build the index once (large runs)"
+    )
+    parser.add_argument(
+        "--workers", 
+        type=int, 
+        help="Key generation processes (default: CPU count, 0 generates inline)"
+    )
     
     args = parser.parse_args()
     
@@ -160,12 +322,12 @@ def main():
     
     try:
         generator = WalletGenerator(args.db_path)
-        generator.generate_wallets(args.count, args.batch_size)
+        generator.generate_wallets(args.count, args.batch_size, args.workers, args.fast, args.bulk)
         
         elapsed = time.time() - start_time
         print(f"⏱️  Total time: {elapsed:.2f} seconds")
         print(f"🚀 Generation rate: {args.count/elapsed:.0f} wallets/second")
-        
+    
     except KeyboardInterrupt:
         print("\n⚠️  Generation interrupted by user")
     except Exception as e: